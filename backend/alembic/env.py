@@ -2,7 +2,7 @@ from logging.config import fileConfig
 import sys
 import os
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 from alembic import context
 
 # ── Make sure the backend package is importable ───────────────────────────────
@@ -52,10 +52,24 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
     with connectable.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # Fail fast instead of queueing behind live traffic if a
+            # migration needs a lock it can't get (session-level, so it
+            # covers every revision in this run).  Commit straight away:
+            # the SET must not leave an autobegun transaction open, or
+            # Alembic would treat the connection as externally managed and
+            # skip its own transaction handling below.
+            connection.execute(text("SET lock_timeout = '5s'"))
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            # Commit each revision on its own.  This also makes
+            # autocommit_block() (used for CREATE INDEX CONCURRENTLY) safe:
+            # it can no longer flush earlier revisions' half-run work.
+            transaction_per_migration=True,
         )
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,54 @@
+"""task_filter_indexes
+
+Revision ID: 481cb44c390b
+Revises: 93cf2b7857e2
+Create Date: 2026-08-31 06:25:10.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '481cb44c390b'
+down_revision: Union[str, None] = '93cf2b7857e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block,
+        # so switch to autocommit for the duration of these statements.
+        with op.get_context().autocommit_block():
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_created_at '
+                'ON tasks (created_at DESC)'
+            )
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                'ix_tasks_status_priority_created_at '
+                'ON tasks (status, priority, created_at DESC)'
+            )
+    else:
+        op.create_index('ix_tasks_created_at', 'tasks', [sa.text('created_at DESC')])
+        op.create_index(
+            'ix_tasks_status_priority_created_at',
+            'tasks',
+            ['status', 'priority', sa.text('created_at DESC')],
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(
+                'DROP INDEX CONCURRENTLY IF EXISTS '
+                'ix_tasks_status_priority_created_at'
+            )
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_created_at')
+    else:
+        op.drop_index('ix_tasks_status_priority_created_at', table_name='tasks')
+        op.drop_index('ix_tasks_created_at', table_name='tasks')
@@ -44,11 +44,26 @@ def upgrade() -> None:
                   server_default=sa.func.now()),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_tasks_id'), 'tasks', ['id'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        # CREATE INDEX CONCURRENTLY must run outside the migration's
+        # transaction; the autocommit block gives it one of its own. On a
+        # fresh table this costs nothing, and it keeps re-runs against a
+        # populated table (e.g. after a stamped baseline) non-blocking.
+        with op.get_context().autocommit_block():
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_id '
+                'ON tasks (id)'
+            )
+    else:
+        op.create_index(op.f('ix_tasks_id'), 'tasks', ['id'], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_tasks_id'), table_name='tasks')
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_id')
+    else:
+        op.drop_index(op.f('ix_tasks_id'), table_name='tasks')
     op.drop_table('tasks')
     op.execute('DROP TYPE IF EXISTS taskstatus')
     op.execute('DROP TYPE IF EXISTS taskpriority')
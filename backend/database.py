@@ -1,34 +1,100 @@
 """
 database.py
 -----------
-SQLAlchemy engine, session factory, and declarative Base.
-Provides the `get_db` dependency used by all FastAPI route handlers.
+Async SQLAlchemy engine, scoped-session registry, and declarative Base.
+Sessions are opened/closed by an HTTP middleware in `main.py`; route
+handlers receive the request's session via the `get_db` dependency.
+
+`DATABASE_URL` stays in sync-driver form (sqlite:/// or postgresql://)
+so Alembic keeps working unchanged; the app engine rewrites it to the
+matching async driver (aiosqlite / asyncpg) below.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import contextvars
+import logging
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from config import settings
 
+
+def _async_url(url: str) -> str:
+    """Rewrite a sync-driver DATABASE_URL to its async-driver equivalent."""
+    if url.startswith("sqlite+aiosqlite") or "+asyncpg" in url:
+        return url
+    if url.startswith("sqlite"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):  # Render-style URL
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# Even with echo off, pin the engine logger at WARNING so an inherited
+# DEBUG root level (e.g. a dev logging config) can't re-enable
+# per-statement logging on the hot path.
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
+
 # ── Engine ────────────────────────────────────────────────────────────────────
-# `check_same_thread=False` is required for SQLite when used with FastAPI
-# (multiple threads share the same connection).  Ignored by PostgreSQL.
-connect_args = (
-    {"check_same_thread": False}
-    if settings.DATABASE_URL.startswith("sqlite")
-    else {}
-)
+# `echo` is deliberately hardcoded off: echoing serialises every statement
+# through Python logging and measurably slows the DB-bound CRUD hot path.
+engine_kwargs: dict = {
+    "echo": False,
+}
+
+# Pool tuning only applies to PostgreSQL; SQLite uses its own pooling and
+# rejects QueuePool arguments.
+if not settings.DATABASE_URL.startswith("sqlite"):
+    if settings.DB_POOL_CLASS == "null":
+        # NullPool keeps no idle connections between requests – the right
+        # trade-off on serverless/short-lived containers where pooled idle
+        # connections pile up across workers and hit the server's limit.
+        # QueuePool sizing arguments don't apply here.
+        engine_kwargs["poolclass"] = NullPool
+    else:
+        engine_kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args=connect_args,
-    echo=settings.DEBUG,   # Log SQL statements in development
+engine = create_async_engine(_async_url(settings.DATABASE_URL), **engine_kwargs)
+
+# ── Session Registry ──────────────────────────────────────────────────────────
+# One session per in-flight request, keyed by a contextvar that the
+# db_session_middleware in `main.py` sets to a unique value per request.
+# Handlers are native async, so queries run on the event loop instead of
+# occupying Starlette threadpool workers.
+session_scope: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+    "db_session_scope",
+    default=None,
 )
 
-# ── Session Factory ───────────────────────────────────────────────────────────
-SessionLocal = sessionmaker(
+# SessionFactory is used directly by endpoints whose session must outlive
+# the middleware's request scope (e.g. streaming responses).
+SessionFactory = async_sessionmaker(
     bind=engine,
     autocommit=False,
     autoflush=False,
+    # Keep attributes readable after commit without implicit (lazy)
+    # IO, which AsyncSession forbids outside an await.
+    expire_on_commit=False,
+)
+
+SessionLocal = async_scoped_session(
+    SessionFactory,
+    scopefunc=session_scope.get,
 )
 
 # ── Declarative Base ──────────────────────────────────────────────────────────
@@ -38,21 +104,18 @@ class Base(DeclarativeBase):
 
 
 # ── Dependency ────────────────────────────────────────────────────────────────
-def get_db():
+def get_db(request: Request) -> AsyncSession:
     """
-    FastAPI dependency that yields a database session per request and
-    guarantees the session is closed when the request completes.
+    FastAPI dependency returning the session that `db_session_middleware`
+    (see `main.py`) opened for the current request.  The middleware is also
+    responsible for removing the session when the request completes.
 
     Usage in routes:
         from fastapi import Depends
         from database import get_db
-        from sqlalchemy.orm import Session
+        from sqlalchemy.ext.asyncio import AsyncSession
 
-        def some_route(db: Session = Depends(get_db)):
+        async def some_route(db: AsyncSession = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    return request.state.db
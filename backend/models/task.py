@@ -16,6 +16,7 @@ from sqlalchemy import (
     Enum,
     Boolean,
     DateTime,
+    Index,
 )
 from database import Base
 
@@ -88,5 +89,18 @@ class Task(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Serves the unfiltered list_tasks branch (ORDER BY created_at DESC).
+        Index("ix_tasks_created_at", created_at.desc()),
+        # Covering index for the status/priority filter path; Postgres can
+        # answer the filtered, ordered page with an index-only range scan.
+        Index(
+            "ix_tasks_status_priority_created_at",
+            status,
+            priority,
+            created_at.desc(),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Task id={self.id!r} title={self.title!r} status={self.status!r}>"
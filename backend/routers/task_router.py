@@ -10,6 +10,7 @@ Endpoints
 ---------
 POST   /tasks/              – Create a new task
 GET    /tasks/              – List all tasks (filterable by status & priority)
+GET    /tasks/stream        – Stream all matching tasks as NDJSON
 GET    /tasks/{task_id}     – Retrieve a single task by ID
 PUT    /tasks/{task_id}     – Full / partial update of a task
 PATCH  /tasks/{task_id}/complete – Mark a task as completed
@@ -19,10 +20,14 @@ DELETE /tasks/{task_id}     – Delete a task
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_db, SessionFactory
 from models.task import Task, TaskStatus, TaskPriority
 from schemas.task_schema import TaskCreate, TaskUpdate, TaskOut, TaskComplete
 from utils.response import success_response, not_found
@@ -32,6 +37,30 @@ router = APIRouter(
     tags=["Tasks"],
 )
 
+# Built once at import time – serialising the whole page through a single
+# pre-compiled adapter is cheaper than per-row model_validate/model_dump.
+_task_list_adapter = TypeAdapter(list[TaskOut])
+
+# Batch size for the streaming endpoint's server-side cursor: rows are
+# fetched (and ORM-hydrated) this many at a time instead of all at once.
+_STREAM_BATCH_SIZE = 500
+_task_out_adapter = TypeAdapter(TaskOut)
+_task_complete_adapter = TypeAdapter(TaskComplete)
+
+
+def _serialize_task(task: Task) -> dict:
+    """Dump one ORM Task to a JSON-safe dict via the pre-built adapter."""
+    return _task_out_adapter.dump_python(
+        _task_out_adapter.validate_python(task), mode="json"
+    )
+
+
+def _serialize_task_complete(task: Task) -> dict:
+    """Dump the thin /complete response via the pre-built adapter."""
+    return _task_complete_adapter.dump_python(
+        _task_complete_adapter.validate_python(task), mode="json"
+    )
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # POST /tasks/  –  Create a new task
@@ -43,9 +72,9 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
 )
-def create_task(
+async def create_task(
     payload: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new task with the supplied data.
@@ -54,19 +83,23 @@ def create_task(
     - **status** defaults to `todo`.
     - **priority** defaults to `medium`.
     """
+    # One timestamp per request: created_at and updated_at get the exact
+    # same value instead of two separate datetime.now() calls on flush.
+    now = datetime.now(timezone.utc)
     new_task = Task(
         title=payload.title,
         description=payload.description,
         status=payload.status,
         priority=payload.priority,
         due_date=payload.due_date,
+        created_at=now,
+        updated_at=now,
     )
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    await db.commit()
 
     return success_response(
-        data=TaskOut.model_validate(new_task).model_dump(mode="json"),
+        data=_serialize_task(new_task),
         message="Task created successfully.",
         status_code=201,
     )
@@ -82,7 +115,7 @@ def create_task(
     status_code=status.HTTP_200_OK,
     summary="List all tasks",
 )
-def list_tasks(
+async def list_tasks(
     status_filter: Optional[TaskStatus] = Query(
         default=None,
         alias="status",
@@ -95,7 +128,7 @@ def list_tasks(
     ),
     skip: int = Query(default=0, ge=0, description="Number of records to skip."),
     limit: int = Query(default=100, ge=1, le=500, description="Max records to return."),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Return a paginated list of tasks, optionally filtered by **status**
@@ -107,30 +140,104 @@ def list_tasks(
     - `skip`     – pagination offset (default 0)
     - `limit`    – page size (default 100, max 500)
     """
-    query = db.query(Task)
+    filters = []
 
     if status_filter is not None:
-        query = query.filter(Task.status == status_filter)
+        filters.append(Task.status == status_filter)
 
     if priority_filter is not None:
-        query = query.filter(Task.priority == priority_filter)
-
-    tasks = query.order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
-    total = query.count()
+        filters.append(Task.priority == priority_filter)
+
+    # Fold the total count into the data query via COUNT(*) OVER () so one
+    # round-trip serves both the page and the pagination metadata.
+    rows = (await db.execute(
+        select(Task, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Task.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )).all()
+
+    tasks = [row.Task for row in rows]
+    total = rows[0].total if rows else 0
+
+    # An empty page either means no matching rows (total really is 0) or an
+    # offset past the end – only the latter needs a dedicated COUNT query.
+    if not rows and skip > 0:
+        total = (await db.execute(
+            select(func.count()).select_from(Task).where(*filters)
+        )).scalar_one()
 
     return success_response(
         data={
             "total": total,
             "skip": skip,
             "limit": limit,
-            "tasks": [
-                TaskOut.model_validate(t).model_dump(mode="json") for t in tasks
-            ],
+            "tasks": _task_list_adapter.dump_python(
+                _task_list_adapter.validate_python(tasks),
+                mode="json",
+            ),
         },
         message=f"{total} task(s) found.",
     )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# GET /tasks/stream  –  Stream all tasks as NDJSON
+# ─────────────────────────────────────────────────────────────────────────────
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream all matching tasks as NDJSON",
+)
+async def stream_tasks(
+    status_filter: Optional[TaskStatus] = Query(
+        default=None,
+        alias="status",
+        description="Filter by task status (todo | in_progress | done).",
+    ),
+    priority_filter: Optional[TaskPriority] = Query(
+        default=None,
+        alias="priority",
+        description="Filter by priority (low | medium | high).",
+    ),
+):
+    """
+    Stream every matching task as newline-delimited JSON, one object per
+    line (`application/x-ndjson`).
+
+    Unlike the paginated listing, peak memory stays flat regardless of
+    result size: rows are orjson-encoded and flushed as they arrive
+    instead of materialising the whole list (and its JSON body) at once.
+    """
+    filters = []
+
+    if status_filter is not None:
+        filters.append(Task.status == status_filter)
+
+    if priority_filter is not None:
+        filters.append(Task.priority == priority_filter)
+
+    async def row_stream():
+        # The generator outlives db_session_middleware's request scope, so
+        # it owns a dedicated session for the duration of the stream.
+        async with SessionFactory() as session:
+            # yield_per keeps the result on a server-side cursor and pulls
+            # rows over in fixed-size batches, so neither the driver nor
+            # the ORM ever holds the full result set in Python memory.
+            result = await session.stream(
+                select(Task)
+                .where(*filters)
+                .order_by(Task.created_at.desc())
+                .execution_options(yield_per=_STREAM_BATCH_SIZE)
+            )
+            async for (task,) in result:
+                yield orjson.dumps(_serialize_task(task)) + b"\n"
+
+    return StreamingResponse(row_stream(), media_type="application/x-ndjson")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # GET /tasks/{task_id}  –  Get a single task
 # ─────────────────────────────────────────────────────────────────────────────
@@ -141,18 +248,18 @@ def list_tasks(
     status_code=status.HTTP_200_OK,
     summary="Get a task by ID",
 )
-def get_task(task_id: int, db: Session = Depends(get_db)):
+async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a single task by its **ID**.
 
     Returns **404** if the task does not exist.
     """
-    task = db.get(Task, task_id)
+    task = await db.get(Task, task_id)
     if not task:
         not_found("Task")
 
     return success_response(
-        data=TaskOut.model_validate(task).model_dump(mode="json"),
+        data=_serialize_task(task),
         message="Task retrieved successfully.",
     )
 
@@ -167,10 +274,10 @@ def get_task(task_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_200_OK,
     summary="Update a task",
 )
-def update_task(
+async def update_task(
     task_id: int,
     payload: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Update one or more fields on an existing task.
@@ -179,23 +286,29 @@ def update_task(
     (partial update behaviour even on a PUT endpoint).
     Returns **404** if the task does not exist.
     """
-    task = db.get(Task, task_id)
-    if not task:
-        not_found("Task")
+    now = datetime.now(timezone.utc)
 
     # Apply only the fields that were explicitly provided
     update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    # Manually bump updated_at (SQLAlchemy onupdate fires on flush, not setattr)
-    task.updated_at = datetime.now(timezone.utc)
+    update_data["updated_at"] = now
+
+    # Single UPDATE ... RETURNING round-trip: no preliminary SELECT, no
+    # post-commit refresh.
+    task = (await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data)
+        .returning(Task)
+    )).scalar_one_or_none()
+
+    if task is None:
+        not_found("Task")
 
-    db.commit()
-    db.refresh(task)
+    data = _serialize_task(task)
+    await db.commit()
 
     return success_response(
-        data=TaskOut.model_validate(task).model_dump(mode="json"),
+        data=data,
         message="Task updated successfully.",
     )
 
@@ -210,26 +323,30 @@ def update_task(
     status_code=status.HTTP_200_OK,
     summary="Mark a task as completed",
 )
-def complete_task(task_id: int, db: Session = Depends(get_db)):
+async def complete_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """
     Set `is_completed = True` and `status = done` on the specified task.
 
     Idempotent – calling this on an already-completed task is safe.
     Returns **404** if the task does not exist.
     """
-    task = db.get(Task, task_id)
-    if not task:
-        not_found("Task")
+    now = datetime.now(timezone.utc)
+
+    task = (await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(is_completed=True, status=TaskStatus.DONE, updated_at=now)
+        .returning(Task)
+    )).scalar_one_or_none()
 
-    task.is_completed = True
-    task.status = TaskStatus.DONE
-    task.updated_at = datetime.now(timezone.utc)
+    if task is None:
+        not_found("Task")
 
-    db.commit()
-    db.refresh(task)
+    data = _serialize_task_complete(task)
+    await db.commit()
 
     return success_response(
-        data=TaskComplete.model_validate(task).model_dump(mode="json"),
+        data=data,
         message="Task marked as completed.",
     )
 
@@ -243,20 +360,22 @@ def complete_task(task_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_200_OK,
     summary="Delete a task",
 )
-def delete_task(task_id: int, db: Session = Depends(get_db)):
+async def delete_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """
     Permanently delete a task by its **ID**.
 
     Returns **404** if the task does not exist.
     """
-    task = db.get(Task, task_id)
-    if not task:
+    deleted_id = (await db.execute(
+        delete(Task).where(Task.id == task_id).returning(Task.id)
+    )).scalar_one_or_none()
+
+    if deleted_id is None:
         not_found("Task")
 
-    db.delete(task)
-    db.commit()
+    await db.commit()
 
     return success_response(
-        data={"deleted_id": task_id},
+        data={"deleted_id": deleted_id},
         message=f"Task {task_id} deleted successfully.",
     )
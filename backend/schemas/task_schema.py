@@ -109,3 +109,11 @@ class TaskComplete(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ── Import-time compilation ──────────────────────────────────────────────────
+# pydantic-core normally builds each model's validator/serialiser at class
+# creation, but defers when a reference can't be resolved yet. Force the
+# rebuild here so no request ever pays for a deferred build.
+for _schema in (TaskBase, TaskCreate, TaskUpdate, TaskOut, TaskComplete):
+    _schema.model_rebuild()